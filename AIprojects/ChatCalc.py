@@ -33,6 +33,8 @@ import argparse
 import sys
 
 # ---- Physical constants / helpers ----
+_QUARTER_PI = 0.25 * pi   # pipe area = _QUARTER_PI * d * d
+
 def lpm_to_m3s(lpm):
     """Convert liters per minute to cubic meters per second."""
     return lpm / 1000.0 / 60.0
@@ -140,7 +142,7 @@ def pressure_drop_pipe(rho, mu, Q, d, L, k=1.5e-6, fittings=None):
         raise ValueError("Flow must be non-negative")
     if d <= 0 or L < 0:
         raise ValueError("Diameter must be positive and length non-negative")
-    A = pi * (d/2.0)**2
+    A = _QUARTER_PI * d * d
     if A <= 0:
         raise ValueError("Invalid diameter generating non-positive area")
     v = Q / A
@@ -172,7 +174,7 @@ def flow_from_pump_pressure(rho, mu, d, L, pump_deltaP_pa, k=1.5e-6, fittings=No
     if pump_deltaP_pa <= 0:
         return 0.0
     # Initial guess: assume friction factor ~0.02 and minor losses 0
-    A = pi * (d/2.0)**2
+    A = _QUARTER_PI * d * d
     # Use energy equation: pump_deltaP = 0.5*rho*v^2*( f*(L/d) + K_total )
     K_total = minor_loss_coeffs(fittings) if fittings else 0.0
     f_guess = 0.02
@@ -193,12 +195,14 @@ def flow_from_pump_pressure(rho, mu, d, L, pump_deltaP_pa, k=1.5e-6, fittings=No
     else:
         # did not converge
         pass
+    # Re and f for the returned v; the loop's last values belong to the previous v
+    Re = reynolds_number(rho, mu, v, d) if v>0 else 0.0
     return {
         'Q_m3s': Q,
         'Q_lpm': m3s_to_lpm(Q),
         'velocity_m_s': v,
-        'Re': reynolds_number(rho, mu, v, d) if v>0 else 0.0,
-        'friction_factor': friction_factor_haland(d, k, reynolds_number(rho, mu, v, d)) if v>0 else 0.0
+        'Re': Re,
+        'friction_factor': friction_factor_haland(d, k, Re) if v>0 else 0.0
     }
 
 # ---- Example default coolant properties ----
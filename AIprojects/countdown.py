@@ -1,5 +1,6 @@
 import calendar
 import datetime
+from functools import lru_cache
 
 
 def get_future_date():
@@ -20,6 +21,11 @@ def get_future_date():
         return today, dt
 
 
+@lru_cache(maxsize=4096)
+def _days_in(y, m):
+    return calendar.monthrange(y, m)[1]
+
+
 def diff_ymd(today, future):
     y1, m1, d1 = today.year, today.month, today.day
     y2, m2, d2 = future.year, future.month, future.day
@@ -29,7 +35,7 @@ def diff_ymd(today, future):
         if m2 == 0:
             m2 = 12
             y2 -= 1
-        days_in_prev_month = calendar.monthrange(y2, m2)[1]
+        days_in_prev_month = _days_in(y2, m2)
         days = d2 + days_in_prev_month - d1
     else:
         days = d2 - d1
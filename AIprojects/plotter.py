@@ -1,10 +1,25 @@
+import os
+from pathlib import Path
+
 import pandas as pd
-import matplotlib.pyplot as plt
 
-# Read the Excel file
+# Set PLOTTER_HEADLESS=1 to save the plots as PNGs instead of opening windows
+HEADLESS = bool(os.environ.get('PLOTTER_HEADLESS'))
+
+# Read the Excel file, or its Parquet copy if that is newer than the workbook
 # Replace 'your_file.xlsx' with your Excel file path
+excel_path = Path('data.xlsx')
+cache_path = excel_path.with_suffix('.parquet')
 try:
-    df = pd.read_excel('data.xlsx')
+    if cache_path.exists() and cache_path.stat().st_mtime >= excel_path.stat().st_mtime:
+        df = pd.read_parquet(cache_path)
+    else:
+        df = pd.read_excel(excel_path, engine='openpyxl')
+        try:
+            df.to_parquet(cache_path)
+        except (ImportError, ValueError, TypeError) as e:
+            # No Parquet engine installed or columns Arrow can't store; just skip the cache
+            print(f"Note: could not write Parquet cache ({e})")
 except FileNotFoundError:
     print("Error: File not found. Please provide the correct file path.")
     exit()
@@ -17,52 +32,43 @@ print("Available columns:", df.columns.tolist())
 column1 = input("Enter first column name to plot: ")
 column2 = input("Enter second column name to plot: ")
 column3 = input("Enter third column name to plot: ")
+cols = [column1, column2, column3]
 
 # Verify if selected columns exist
-if not all(col in df.columns for col in [column1, column2, column3]):
+if not all(col in df.columns for col in cols):
     print("Error: One or more selected columns not found in the Excel file.")
-#    exit()
+    exit()
 
-# Create a figure with three subplots
-fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 12))
-#fig, (ax1, ax2, ax3) = plt.subplots(1, 1, figsize=(10, 12)) # trying one plot
-# Plot each column
-ax1.plot(df[column1], label=column1, color='blue')
-ax1.set_title(f'{column1} Plot')
-ax1.set_xlabel('Index')
-ax1.set_ylabel(column1)
-ax1.grid(True)
-ax1.legend()
+# Keep just the selected columns
+df = df[cols]
 
-ax2.plot(df[column2], label=column2, color='green')
-ax2.set_title(f'{column2} Plot')
-ax2.set_xlabel('Index')
-ax2.set_ylabel(column2)
-ax2.grid(True)
-ax2.legend()
+# Import pyplot only now, so runs that stop above don't pay for backend start-up
+import matplotlib
+if HEADLESS:
+    matplotlib.use('Agg')
+import matplotlib.pyplot as plt
 
-ax3.plot(df[column3], label=column3, color='red')
-ax3.set_title(f'{column3} Plot')
-ax3.set_xlabel('Index')
-ax3.set_ylabel(column3)
-ax3.grid(True)
-ax3.legend()
+# One subplot per column, sharing the styling
+axes = df.plot(subplots=True, figsize=(10, 12), grid=True,
+                     color=['blue', 'green', 'red'], legend=True,
+                     title=[f'{col} Plot' for col in cols], xlabel='Index')
+for ax, col in zip(axes, cols):
+    ax.set_ylabel(col)
 
 # Adjust layout to prevent overlap
 plt.tight_layout()
 
 # Show the plot
-plt.show()
+if HEADLESS:
+    plt.savefig('out.png')
+else:
+    plt.show()
 
 # Optional: Plot all three columns together in a single plot
-plt.figure(figsize=(10, 6))
-plt.plot(df[column1], label=column1, color='blue')
-plt.plot(df[column2], label=column2, color='green')
-plt.plot(df[column3], label=column3, color='red')
-plt.title('Combined Plot of Selected Columns')
-plt.xlabel('Index')
-plt.ylabel('Values')
-plt.grid(True)
-plt.legend()
-plt.show()
-print(df.mean(numeric_only=True))
\ No newline at end of file
+df.plot(figsize=(10, 6), color=['blue', 'green', 'red'], grid=True,
+              title='Combined Plot of Selected Columns', xlabel='Index', ylabel='Values')
+if HEADLESS:
+    plt.savefig('out_combined.png')
+else:
+    plt.show()
+print(df.mean(numeric_only=True))
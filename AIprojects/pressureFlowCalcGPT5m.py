@@ -11,9 +11,14 @@ pressure and flow.
 Functions included:
 - reynolds_number(rho, mu, v, d)
 - friction_factor_haland(d, k, Re)
+- friction_factor_haland_vec(d, k, Re)  # NumPy array version for sweeps
+- friction_factor_colebrook_praks(d, k, Re)
+- friction_factor_colebrook_praks_vec(d, k, Re)
+- friction_factor_lut(d, k, Re)  # table lookup for large batch studies
 - darcy_weisbach_loss(f, L, d, v)
 - minor_loss_coeffs(fittings)  # rough estimate for standard fittings
 - pressure_drop_pipe(rho, mu, Q, d, L, k=1.5e-6, fittings=None)
+- make_deltaP_fn(rho, mu, d, L, k=1.5e-6, fittings=None)  # deltaP(Q) for a fixed hose
 - flow_from_pump_pressure(rho, mu, d, L, pump_deltaP, k=1.5e-6, fittings=None)
 - convert_units helpers
 
@@ -24,15 +29,26 @@ Command-line usage:
 Notes:
 - Default roughness k (m) is about 1.5e-6 for commercial-grade smooth steel or
   rigid tubing; for rubber hoses roughness can be higher (1e-5 to 1e-4).
-- Uses Haaland approximation for friction factor.
+- Friction factor is solved from Colebrook with the Praks-Brkic one-log
+  iteration (Pade approximants replace the log in later steps); Haaland is kept
+  for quick estimates.
+- pressure_drop_pipe accepts a NumPy array for Q (and flow_from_pump_pressure
+  one for pump_deltaP) so a whole sweep is computed in one call. If Numba is
+  installed, array sweeps are JIT-compiled and run in parallel; single values
+  always run as plain Python.
 - Fluid properties must be provided in SI units (rho kg/m^3, mu Pa.s).
 """
 
-from math import log10, sqrt, pi
+from functools import lru_cache
+from math import log, log10, sqrt, pi
 import argparse
 import sys
 
+import numpy as np
+
 # ---- Physical constants / helpers ----
+_QUARTER_PI = 0.25 * pi   # pipe area = _QUARTER_PI * d * d
+
 def lpm_to_m3s(lpm):
     """Convert liters per minute to cubic meters per second."""
     return lpm / 1000.0 / 60.0
@@ -64,12 +80,14 @@ def reynolds_number(rho, mu, v, d):
     Re = (rho * v * d) / mu
     return Re
 
-def friction_factor_haland(d, k, Re):
+def friction_factor_haland(d, k, Re, kd_term=None):
     """
     Haaland approximation for turbulent flow friction factor f (Darcy).
     d : pipe diameter (m)
     k : absolute roughness (m)
     Re: Reynolds number
+    kd_term: optional precomputed (k/(3.7*d))**1.11; it only depends on the
+             geometry, so callers looping over Re can compute it once
     Returns f (dimensionless)
     """
     if Re <= 0:
@@ -78,10 +96,131 @@ def friction_factor_haland(d, k, Re):
     if Re < 2300:
         return 64.0 / Re
     # Haaland equation
-    term = (k / (3.7 * d))**1.11 + 6.9 / Re
+    if kd_term is None:
+        kd_term = (k / (3.7 * d))**1.11
+    term = kd_term + 6.9 / Re
     f = ( -1.8 * log10(term) )**-2
     return f
 
+def friction_factor_haland_vec(d, k, Re):
+    """
+    Vectorized friction_factor_haland for NumPy arrays of Re (and/or d, k).
+    Same laminar/Haaland switch at Re = 2300, applied element-wise.
+    Re must be positive everywhere; callers mask out zero-flow points.
+    Returns an ndarray of f (dimensionless)
+    """
+    Re = np.asarray(Re, dtype=float)
+    if np.any(Re <= 0):
+        raise ValueError("Reynolds number must be positive")
+    lam = 64.0 / Re
+    term = (k / (3.7 * d))**1.11 + 6.9 / Re
+    turb = ( -1.8 * np.log10(term) )**-2
+    return np.where(Re < 2300, lam, turb)
+
+# Praks-Brkic: Colebrook written as x = -2*log10(a + b*x) with x = 1/sqrt(f),
+# a = k/(3.7*d), b = 2.51/Re. Only the seed needs a real log; each Newton step
+# then updates ln(a + b*x) with a [3/3] Pade approximant of ln(1 + z).
+_PB_X0 = 8.0               # seed for x = 1/sqrt(f) (f ~ 0.0156)
+_PB_C = 2.0 / log(10.0)    # -2*log10(y) == -_PB_C*ln(y)
+_PB_ITERS = 3
+
+def _pade_log1p(z):
+    """[3/3] Pade approximant of ln(1 + z), accurate for small |z|."""
+    return z * (60.0 + z * (60.0 + 11.0 * z)) / (60.0 + z * (90.0 + z * (36.0 + 3.0 * z)))
+
+def _praks_brkic_x(a, b, ln_y):
+    """
+    Newton iterations on x + C*ln(a + b*x) = 0 starting from x = _PB_X0, where
+    ln_y is ln(a + b*_PB_X0). Pure arithmetic so it works on floats and arrays.
+    """
+    x = _PB_X0
+    y = a + b * x
+    for _ in range(_PB_ITERS):
+        x_new = x - (x + _PB_C * ln_y) / (1.0 + _PB_C * b / y)
+        y_new = a + b * x_new
+        ln_y = ln_y + _pade_log1p(y_new / y - 1.0)
+        x, y = x_new, y_new
+    return x
+
+def friction_factor_colebrook_praks(d, k, Re):
+    """
+    Colebrook friction factor f (Darcy) via the Praks-Brkic one-log iteration.
+    d : pipe diameter (m)
+    k : absolute roughness (m)
+    Re: Reynolds number
+    Agrees with the exact Colebrook solution to better than 1e-5 (relative)
+    for 2300 <= Re <= 1e8 and k/d up to 0.05. Laminar flow uses f = 64/Re.
+    Returns f (dimensionless)
+    """
+    if Re <= 0:
+        raise ValueError("Reynolds number must be positive")
+    if Re < 2300:
+        return 64.0 / Re
+    return _friction_turb_kernel(k / (3.7 * d), Re)
+
+def friction_factor_colebrook_praks_vec(d, k, Re):
+    """
+    Vectorized friction_factor_colebrook_praks for NumPy arrays of Re.
+    Re must be positive everywhere; callers mask out zero-flow points.
+    Returns an ndarray of f (dimensionless)
+    """
+    Re = np.asarray(Re, dtype=float)
+    if np.any(Re <= 0):
+        raise ValueError("Reynolds number must be positive")
+    a = k / (3.7 * d)
+    b = 2.51 / Re
+    x = _praks_brkic_x(a, b, np.log(a + b * _PB_X0))
+    return np.where(Re < 2300, 64.0 / Re, 1.0 / (x * x))
+
+# ---- Tabulated friction factor ----
+# Colebrook f on a log-spaced grid of Re (2300..1e8) and relative roughness k/d
+# (1e-7..1e-2), built once at import. Bilinear interpolation in log space
+# stays within ~2e-4 (relative) of friction_factor_colebrook_praks.
+_FF_NRE = 512
+_FF_NED = 128
+_FF_LOG_RE_LO = log10(2300.0)
+_FF_LOG_RE_HI = 8.0
+_FF_LOG_ED_LO = -7.0
+_FF_LOG_ED_HI = -2.0
+_FF_RE_STEP = (_FF_LOG_RE_HI - _FF_LOG_RE_LO) / (_FF_NRE - 1)
+_FF_ED_STEP = (_FF_LOG_ED_HI - _FF_LOG_ED_LO) / (_FF_NED - 1)
+_FF_TABLE = friction_factor_colebrook_praks_vec(
+    1.0,
+    np.logspace(_FF_LOG_ED_LO, _FF_LOG_ED_HI, _FF_NED)[np.newaxis, :],
+    np.logspace(_FF_LOG_RE_LO, _FF_LOG_RE_HI, _FF_NRE)[:, np.newaxis],
+)
+
+def friction_factor_lut(d, k, Re):
+    """
+    Friction factor f (Darcy) by bilinear interpolation in _FF_TABLE.
+    d : pipe diameter (m)
+    k : absolute roughness (m)
+    Re: Reynolds number
+    Laminar flow uses f = 64/Re; points outside the table (Re > 1e8 or k/d
+    outside 1e-7..1e-2) fall back to friction_factor_colebrook_praks.
+    Returns f (dimensionless)
+    """
+    if Re <= 0:
+        raise ValueError("Reynolds number must be positive")
+    if Re < 2300:
+        return 64.0 / Re
+    eD = k / d
+    if eD <= 0:
+        return friction_factor_colebrook_praks(d, k, Re)
+    i = (log10(Re) - _FF_LOG_RE_LO) / _FF_RE_STEP
+    j = (log10(eD) - _FF_LOG_ED_LO) / _FF_ED_STEP
+    if i > _FF_NRE - 1 or j < 0 or j > _FF_NED - 1:
+        return friction_factor_colebrook_praks(d, k, Re)
+    i0 = min(int(i), _FF_NRE - 2)
+    j0 = min(int(j), _FF_NED - 2)
+    ti = i - i0
+    tj = j - j0
+    row0 = _FF_TABLE[i0]
+    row1 = _FF_TABLE[i0 + 1]
+    f0 = row0[j0] + (row1[j0] - row0[j0]) * ti
+    f1 = row0[j0 + 1] + (row1[j0 + 1] - row0[j0 + 1]) * ti
+    return float(f0 + (f1 - f0) * tj)
+
 def darcy_weisbach_loss(f, L, d, v):
     """
     Darcy-Weisbach frictional head loss (Pa).
@@ -113,9 +252,15 @@ def minor_loss_coeffs(fittings):
     """
     Sum K coefficients for a list of fittings. fittings is an iterable of keys
     from STANDARD_FITTING_K. Unknown fittings will raise a KeyError.
+    Totals are cached per fitting set (order does not matter), so edits to
+    STANDARD_FITTING_K after the first call need _minor_loss_total.cache_clear().
     """
     if not fittings:
         return 0.0
+    return _minor_loss_total(tuple(sorted(fittings)))
+
+@lru_cache(maxsize=128)
+def _minor_loss_total(fittings):
     K_total = 0.0
     for f in fittings:
         if f not in STANDARD_FITTING_K:
@@ -123,6 +268,175 @@ def minor_loss_coeffs(fittings):
         K_total += STANDARD_FITTING_K[f]
     return K_total
 
+# ---- Kernels ----
+# Scalar math behind pressure_drop_pipe / flow_from_pump_pressure. Scalar calls
+# run them as plain Python; the array/batch paths compile them with Numba (see
+# _numba) when it is installed.
+def _friction_kernel(a, Re):
+    """
+    Colebrook/laminar friction factor for the kernels (Re > 0, no validation).
+    a is the geometry-only term k/(3.7*d), computed once by the caller.
+    """
+    if Re < 2300.0:
+        return 64.0 / Re
+    return _friction_turb_kernel(a, Re)
+
+def _friction_turb_kernel(a, Re):
+    """Colebrook branch of _friction_kernel, for callers that know Re >= 2300."""
+    b = 2.51 / Re
+    x = _praks_brkic_x(a, b, log(a + b * _PB_X0))
+    return 1.0 / (x * x)
+
+def _pressure_drop_kernel(Q, inv_A, L_over_d, half_rho, rho_d_over_mu, rough_term, K_total):
+    """
+    Returns (v, Re, f, friction_loss_Pa, minor_loss_Pa) for one flow Q. The
+    geometry terms are computed once by the caller, as in make_deltaP_fn.
+    """
+    v = Q * inv_A
+    if v > 0:
+        Re = rho_d_over_mu * v
+        f = _friction_kernel(rough_term, Re)
+    else:
+        Re = 0.0
+        f = 0.0
+    dyn = half_rho * v * v
+    # Frictional loss (Pa) = f*(L/d)*0.5*rho*v^2, minor losses = K_total*0.5*rho*v^2
+    return v, Re, f, f * L_over_d * dyn, K_total * dyn
+
+def _friction_turb_slope_kernel(a, Re, f):
+    """
+    df/dRe on the Colebrook branch. Differentiating x = -C*ln(a + b*x)
+    implicitly (x = 1/sqrt(f), b = 2.51/Re) needs no extra log call.
+    """
+    x = 1.0 / sqrt(f)
+    b = 2.51 / Re
+    dx_dRe = _PB_C * x * b / (Re * (a + b * x + _PB_C * b))
+    return -2.0 * f * dx_dRe / x
+
+def _newton_flow_kernel(deltaP, v, L_over_d, half_rho, rho_d_over_mu, rough_term, K_total, tol, maxiter):
+    """
+    Newton steps on g(v) = 0.5*rho*v^2*(f*L/d + K_total) - deltaP from v, on
+    the Colebrook branch only; the caller handles laminar flow and the gap.
+    Returns (v, Re, f). On convergence Re and f are from the last step, within
+    tol of v; if maxiter runs out they are recomputed from the final v.
+    """
+    rho = 2.0 * half_rho
+    Re = 0.0
+    f = 0.0
+    for i in range(maxiter):
+        Re = rho_d_over_mu * v
+        f = _friction_turb_kernel(rough_term, Re)
+        df_dRe = _friction_turb_slope_kernel(rough_term, Re, f)
+        loss_coeff = f * L_over_d + K_total
+        g = half_rho * v * v * loss_coeff - deltaP
+        dg_dv = rho * v * loss_coeff + half_rho * v * v * L_over_d * df_dRe * rho_d_over_mu
+        if dg_dv <= 0:
+            raise RuntimeError("Denominator non-positive during iteration")
+        v_new = v - g / dg_dv
+        if v_new <= 0:
+            # Overshot past zero flow; back off toward it instead
+            v_new = 0.5 * v
+        converged = abs(v_new - v) < tol
+        v = v_new
+        if converged:
+            break
+    else:
+        # Did not converge: report Re and f for the v actually returned
+        Re = rho_d_over_mu * v
+        f = _friction_turb_kernel(rough_term, Re)
+    return v, Re, f
+
+def _flow_from_deltaP_kernel(rho, mu, d, L, deltaP, k, K_total, tol, maxiter):
+    """Returns (v, Re, f) achievable with pump pressure deltaP (Pa)."""
+    if deltaP <= 0:
+        return 0.0, 0.0, 0.0
+    # Use energy equation: pump_deltaP = 0.5*rho*v^2*( f*(L/d) + K_total )
+    # Loop invariants: only v (and hence Re, f) changes between iterations
+    L_over_d = L / d
+    half_rho = 0.5 * rho
+    rho_d_over_mu = rho * d / mu
+    rough_term = k / (3.7 * d)
+    # Laminar (f = 64/Re) makes the energy equation a quadratic in v:
+    # 0.5*rho*K_total*v^2 + (32*mu*L/d^2)*v - deltaP = 0. If its root is below
+    # Re = 2300 it is the answer (the friction factor only jumps up at 2300).
+    lam_B = 32.0 * mu * L / (d * d)
+    lam_denom = lam_B + sqrt(lam_B * lam_B + 4.0 * half_rho * K_total * deltaP)
+    if lam_denom <= 0:
+        raise RuntimeError("Denominator non-positive during iteration")
+    v = 2.0 * deltaP / lam_denom
+    Re = rho_d_over_mu * v
+    if Re < 2300.0:
+        return v, Re, 64.0 / Re
+    # Otherwise turbulent: initial guess assumes friction factor ~0.02
+    f_guess = 0.02
+    v0 = sqrt(deltaP / (half_rho * (f_guess * L_over_d + K_total)))
+    v, Re, f = _newton_flow_kernel(deltaP, v0, L_over_d, half_rho, rho_d_over_mu, rough_term, K_total, tol, maxiter)
+    if Re < 2300.0:
+        # Transition gap: the laminar root is above Re = 2300 and the turbulent
+        # one below it, so there is no root. deltaP lies between the laminar and
+        # turbulent losses at Re = 2300; report that boundary point.
+        Re = 2300.0
+        v = Re / rho_d_over_mu
+        f = _friction_kernel(rough_term, Re)
+    return v, Re, f
+
+def _make_batch_loops(prange):
+    """
+    Build the batch loops over the scalar kernels with prange as the loop
+    range: numba.prange for the parallel compiled versions, range otherwise.
+    """
+    def _pressure_drop_batch(Q, inv_A, L_over_d, half_rho, rho_d_over_mu, rough_term, K_total):
+        n = Q.shape[0]
+        v = np.empty(n)
+        Re = np.empty(n)
+        f = np.empty(n)
+        friction_loss = np.empty(n)
+        minor_loss = np.empty(n)
+        for i in prange(n):
+            v[i], Re[i], f[i], friction_loss[i], minor_loss[i] = _pressure_drop_kernel(Q[i], inv_A, L_over_d, half_rho, rho_d_over_mu, rough_term, K_total)
+        return v, Re, f, friction_loss, minor_loss
+
+    def _flow_from_deltaP_batch(rho, mu, d, L, deltaP, k, K_total, tol, maxiter):
+        n = deltaP.shape[0]
+        v = np.empty(n)
+        Re = np.empty(n)
+        f = np.empty(n)
+        for i in prange(n):
+            v[i], Re[i], f[i] = _flow_from_deltaP_kernel(rho, mu, d, L, deltaP[i], k, K_total, tol, maxiter)
+        return v, Re, f
+
+    return _pressure_drop_batch, _flow_from_deltaP_batch
+
+# Serial plain-Python loops, used when Numba is not installed
+_pressure_drop_batch, _flow_from_deltaP_batch = _make_batch_loops(range)
+
+@lru_cache(maxsize=None)
+def _numba():
+    """
+    Import Numba on first use and register the scalar kernels so compiled code
+    can call them. Returns the numba module, or None when it is not installed.
+    Only batch paths call this, so single CLI calls never import or compile it.
+    """
+    try:
+        import numba
+        from numba.extending import register_jitable
+    except ImportError:
+        return None
+    for fn in (_pade_log1p, _praks_brkic_x, _friction_turb_kernel, _friction_kernel,
+               _friction_turb_slope_kernel, _pressure_drop_kernel,
+               _newton_flow_kernel, _flow_from_deltaP_kernel):
+        register_jitable(fastmath=True)(fn)
+    return numba
+
+@lru_cache(maxsize=None)
+def _batch_kernels():
+    """Compiled (_pressure_drop_batch, _flow_from_deltaP_batch), or None without Numba."""
+    numba = _numba()
+    if numba is None:
+        return None
+    jit = numba.njit(parallel=True, cache=True, fastmath=True)
+    return tuple(jit(fn) for fn in _make_batch_loops(numba.prange))
+
 # ---- High-level calculations ----
 def pressure_drop_pipe(rho, mu, Q, d, L, k=1.5e-6, fittings=None):
     """
@@ -135,22 +449,86 @@ def pressure_drop_pipe(rho, mu, Q, d, L, k=1.5e-6, fittings=None):
     k   : absolute roughness (m) (default 1.5e-6)
     fittings: iterable of fitting keys for minor losses
     Returns: total pressure drop in Pascals (Pa)
+    If Q is array-like the values in the returned dict are arrays as well.
     """
-    if Q < 0:
-        raise ValueError("Flow must be non-negative")
     if d <= 0 or L < 0:
         raise ValueError("Diameter must be positive and length non-negative")
-    A = pi * (d/2.0)**2
-    if A <= 0:
-        raise ValueError("Invalid diameter generating non-positive area")
-    v = Q / A
-    Re = reynolds_number(rho, mu, v, d) if v > 0 else 0.0
-    f = friction_factor_haland(d, k, Re) if v > 0 else 0.0
-    # Frictional loss (Pa) = f*(L/d)*0.5*rho*v^2
-    friction_loss = f * (L / d) * 0.5 * rho * v**2
-    # Minor losses (Pa) = K_total * 0.5*rho*v^2
+    if mu <= 0:
+        raise ValueError("Viscosity and diameter must be positive")
+    K_total = minor_loss_coeffs(fittings) if fittings else 0.0
+    # Geometry-only terms, computed once for every Q
+    inv_A = 1.0 / (_QUARTER_PI * d * d)
+    L_over_d = L / d
+    half_rho = 0.5 * rho
+    rho_d_over_mu = rho * d / mu
+    rough_term = k / (3.7 * d)
+    if np.ndim(Q) > 0:
+        Q = np.asarray(Q, dtype=float)
+        if np.any(Q < 0):
+            raise ValueError("Flow must be non-negative")
+        kernels = _batch_kernels()
+        if kernels is None:
+            return _pressure_drop_pipe_vec(rho, mu, Q, d, L, k, K_total)
+        results = kernels[0](Q.ravel(), inv_A, L_over_d, half_rho, rho_d_over_mu, rough_term, K_total)
+        v, Re, f, friction_loss, minor_loss = (r.reshape(Q.shape) for r in results)
+    else:
+        if Q < 0:
+            raise ValueError("Flow must be non-negative")
+        v, Re, f, friction_loss, minor_loss = _pressure_drop_kernel(float(Q), inv_A, L_over_d, half_rho, rho_d_over_mu, rough_term, K_total)
+    total_loss = friction_loss + minor_loss
+    return {
+        'Q_m3s': Q,
+        'velocity_m_s': v,
+        'Re': Re,
+        'friction_factor': f,
+        'friction_loss_Pa': friction_loss,
+        'minor_loss_Pa': minor_loss,
+        'total_loss_Pa': total_loss,
+        'total_loss_psi': pa_to_psi(total_loss)
+    }
+
+def make_deltaP_fn(rho, mu, d, L, k=1.5e-6, fittings=None):
+    """
+    Build deltaP(Q) -> total pressure drop (Pa) for one fixed hose geometry.
+    Validation, area, L/d, K_total and the roughness term are done once here,
+    so a design study sweeping Q only pays for Re, f and the loss per call.
+    Same arguments as pressure_drop_pipe minus Q. With Numba installed the
+    returned function is compiled on its first call.
+    """
+    if d <= 0 or L < 0:
+        raise ValueError("Diameter must be positive and length non-negative")
+    if mu <= 0:
+        raise ValueError("Viscosity and diameter must be positive")
+    inv_A = 1.0 / (_QUARTER_PI * d * d)
+    L_over_d = L / d
     K_total = minor_loss_coeffs(fittings) if fittings else 0.0
-    minor_loss = K_total * 0.5 * rho * v**2
+    rough_term = k / (3.7 * d)
+    half_rho = 0.5 * rho
+    rho_d_over_mu = rho * d / mu
+
+    def deltaP(Q):
+        if Q < 0:
+            raise ValueError("Flow must be non-negative")
+        if Q == 0:
+            return 0.0
+        v = Q * inv_A
+        f = _friction_kernel(rough_term, rho_d_over_mu * v)
+        return half_rho * v * v * (f * L_over_d + K_total)
+
+    numba = _numba()
+    return numba.njit(fastmath=True)(deltaP) if numba is not None else deltaP
+
+def _pressure_drop_pipe_vec(rho, mu, Q, d, L, k, K_total):
+    """Array-Q path of pressure_drop_pipe without Numba; one NumPy pass over the sweep."""
+    A = _QUARTER_PI * d * d
+    v = Q / A
+    flowing = v > 0
+    Re = np.where(flowing, (rho * v * d) / mu, 0.0)
+    # Substitute Re = 1 at zero-flow points so the ufuncs stay finite, then mask
+    f = np.where(flowing, friction_factor_colebrook_praks_vec(d, k, np.where(flowing, Re, 1.0)), 0.0)
+    dyn = 0.5 * rho * v**2
+    friction_loss = f * (L / d) * dyn
+    minor_loss = K_total * dyn
     total_loss = friction_loss + minor_loss
     return {
         'Q_m3s': Q,
@@ -167,38 +545,30 @@ def flow_from_pump_pressure(rho, mu, d, L, pump_deltaP_pa, k=1.5e-6, fittings=No
     """
     Given available pump pressure (Pa), estimate achievable flow (m^3/s) through
     the pipe/hose. Solves for Q iteratively because friction factor depends on Re.
-    Returns Q (m^3/s).
+    Returns a dict with Q_m3s, Q_lpm, velocity_m_s, Re and friction_factor; Re
+    and friction_factor always describe the returned velocity, also when the
+    iteration stops at maxiter. No pump pressure (<= 0) gives all zeros.
+    If pump_deltaP_pa is array-like every point is solved (in parallel with
+    Numba) and the values in the returned dict are arrays.
     """
-    if pump_deltaP_pa <= 0:
-        return 0.0
-    # Initial guess: assume friction factor ~0.02 and minor losses 0
-    A = pi * (d/2.0)**2
-    # Use energy equation: pump_deltaP = 0.5*rho*v^2*( f*(L/d) + K_total )
+    if mu <= 0 or d <= 0:
+        raise ValueError("Viscosity and diameter must be positive")
     K_total = minor_loss_coeffs(fittings) if fittings else 0.0
-    f_guess = 0.02
-    v = sqrt((2 * pump_deltaP_pa) / (rho * (f_guess * (L/d) + K_total)))
-    Q = A * v
-    for i in range(maxiter):
-        Re = reynolds_number(rho, mu, v, d)
-        f = friction_factor_haland(d, k, Re) if v > 0 else 0.0
-        denom = rho * (f * (L/d) + K_total) / 2.0
-        if denom <= 0:
-            raise RuntimeError("Denominator non-positive during iteration")
-        v_new = sqrt(pump_deltaP_pa / denom)
-        if abs(v_new - v) < tol:
-            v = v_new
-            break
-        v = v_new
-        Q = A * v
+    if np.ndim(pump_deltaP_pa) > 0:
+        deltaP = np.asarray(pump_deltaP_pa, dtype=float)
+        kernels = _batch_kernels()
+        batch = kernels[1] if kernels is not None else _flow_from_deltaP_batch
+        results = batch(rho, mu, d, L, deltaP.ravel(), k, K_total, tol, maxiter)
+        v, Re, f = (r.reshape(deltaP.shape) for r in results)
     else:
-        # did not converge
-        pass
+        v, Re, f = _flow_from_deltaP_kernel(rho, mu, d, L, float(pump_deltaP_pa), k, K_total, tol, maxiter)
+    Q = _QUARTER_PI * d * d * v
     return {
         'Q_m3s': Q,
         'Q_lpm': m3s_to_lpm(Q),
         'velocity_m_s': v,
-        'Re': reynolds_number(rho, mu, v, d) if v>0 else 0.0,
-        'friction_factor': friction_factor_haland(d, k, reynolds_number(rho, mu, v, d)) if v>0 else 0.0
+        'Re': Re,
+        'friction_factor': f
     }
 
 # ---- Example default coolant properties ----
@@ -243,21 +613,28 @@ def main(argv):
     if args.flow is not None:
         Q_m3s = lpm_to_m3s(args.flow)
         result = pressure_drop_pipe(rho, mu, Q_m3s, d, args.length, k=k, fittings=fittings)
-        print(f"Input: flow = {args.flow:.2f} L/min, dia = {m_to_mm(d):.2f} mm, length = {args.length:.2f} m")
-        print(f"Velocity = {result['velocity_m_s']:.3f} m/s")
-        print(f"Re = {result['Re']:.0f}")
-        print(f"Friction factor f = {result['friction_factor']:.5f}")
-        print(f"Frictional loss = {result['friction_loss_Pa']:.1f} Pa ({pa_to_psi(result['friction_loss_Pa']):.3f} psi)")
-        print(f"Minor loss = {result['minor_loss_Pa']:.1f} Pa ({pa_to_psi(result['minor_loss_Pa']):.3f} psi)")
-        print(f"Total pressure drop = {result['total_loss_Pa']:.1f} Pa ({result['total_loss_psi']:.3f} psi)")
+        out = "\n".join([
+            f"Input: flow = {args.flow:.2f} L/min, dia = {m_to_mm(d):.2f} mm, length = {args.length:.2f} m",
+            f"Velocity = {result['velocity_m_s']:.3f} m/s",
+            f"Re = {result['Re']:.0f}",
+            f"Friction factor f = {result['friction_factor']:.5f}",
+            f"Frictional loss = {result['friction_loss_Pa']:.1f} Pa ({pa_to_psi(result['friction_loss_Pa']):.3f} psi)",
+            f"Minor loss = {result['minor_loss_Pa']:.1f} Pa ({pa_to_psi(result['minor_loss_Pa']):.3f} psi)",
+            f"Total pressure drop = {result['total_loss_Pa']:.1f} Pa ({result['total_loss_psi']:.3f} psi)",
+        ])
+        # One write instead of a print per line
+        sys.stdout.write(out + "\n")
     elif args.pump_psi is not None:
         pump_pa = psi_to_pa(args.pump_psi)
         res = flow_from_pump_pressure(rho, mu, d, args.length, pump_pa, k=k, fittings=fittings)
-        print(f"Input: pump deltaP = {args.pump_psi:.3f} psi, dia = {m_to_mm(d):.2f} mm, length = {args.length:.2f} m")
-        print(f"Estimated flow = {res['Q_lpm']:.2f} L/min")
-        print(f"Velocity = {res['velocity_m_s']:.3f} m/s")
-        print(f"Re = {res['Re']:.0f}")
-        print(f"Friction factor f = {res['friction_factor']:.5f}")
+        out = "\n".join([
+            f"Input: pump deltaP = {args.pump_psi:.3f} psi, dia = {m_to_mm(d):.2f} mm, length = {args.length:.2f} m",
+            f"Estimated flow = {res['Q_lpm']:.2f} L/min",
+            f"Velocity = {res['velocity_m_s']:.3f} m/s",
+            f"Re = {res['Re']:.0f}",
+            f"Friction factor f = {res['friction_factor']:.5f}",
+        ])
+        sys.stdout.write(out + "\n")
     else:
         # Print help summary example
         print("No --flow or --pump_psi supplied. Example usages:")
@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import math
+import time
 import tkinter as tk
 from tkinter import ttk
 
@@ -13,8 +15,8 @@ class CountdownTimer:
         self.flashing = False
         self._timer_id = None
         self._flash_id = None
-        self._display_updater = None
         self.remaining = 0
+        self._deadline = 0.0
         self.flash_state = False
 
         # Input controls for hours, minutes, seconds
@@ -63,16 +65,15 @@ class CountdownTimer:
         self.secs_sb.delete(0, "end")
         self.secs_sb.insert(0, "10")
 
-        # Keep updating the label when not running so user sees adjustments
-        self._schedule_display_update()
+        # Update the label when the user adjusts a spinbox (arrows or typing)
+        for sb in (self.hours_sb, self.mins_sb, self.secs_sb):
+            sb.config(command=self._update_display)
+            sb.bind("<KeyRelease>", lambda e: self._update_display())
+        self._update_display()
 
         # Ensure we clean up after ourselves
         root.protocol("WM_DELETE_WINDOW", self._on_close)
 
-    def _schedule_display_update(self):
-        self._update_display()
-        self._display_updater = self.root.after(200, self._schedule_display_update)
-
     def _update_display(self):
         if self.running:
             h, m, s = self._hms_from_seconds(self.remaining)
@@ -118,17 +119,22 @@ class CountdownTimer:
             self._time_up()
             return
 
+        # Count down against the monotonic clock so late `after` callbacks don't drift
+        self._deadline = time.monotonic() + total
         self.running = True
         self._tick()
 
     def _tick(self):
+        rem = self._deadline - time.monotonic()
+        self.remaining = max(0, int(math.ceil(rem)))
         self._update_display()
-        if self.remaining <= 0:
+        if rem <= 0:
             self.running = False
             self._time_up()
             return
-        self.remaining -= 1
-        self._timer_id = self.root.after(1000, self._tick)
+        # Wake just after the displayed second rolls over
+        delay = int((rem - math.floor(rem)) * 1000) + 1
+        self._timer_id = self.root.after(delay, self._tick)
 
     def stop(self):
         # Stops/pauses the countdown and any flashing
@@ -142,6 +148,7 @@ class CountdownTimer:
         self._set_spinboxes_state("normal")
         if self.flashing:
             self._stop_flashing()
+        self._update_display()
 
     def _set_spinboxes_state(self, state):
         for sb in (self.hours_sb, self.mins_sb, self.secs_sb):
@@ -216,11 +223,6 @@ class CountdownTimer:
                 self.root.after_cancel(self._flash_id)
             except Exception:
                 pass
-        if self._display_updater:
-            try:
-                self.root.after_cancel(self._display_updater)
-            except Exception:
-                pass
         self.root.destroy()
 
 
@@ -3,47 +3,117 @@ coolantHoseExpansion.py
 Keith Bozin 2026-02-18 started
 The purpose of this program is to calculate the needed makeup volume for the pressure pulsing coolant cart
 
+Run with no arguments to be asked for each value, or pass them all on the command line:
+    python coolantHoseExpansion.py --length-ft 10 --diam-in 1.5 --delta-diam-cm 0.1 --n-hoses 4 --bore-in 2
+Add --csv to get one header line and one value line instead of the report.
 """
+import argparse
 import math # needed for pi
+import sys
 
-# Calculate lenght of hose in cm
-lengthFeet = float(input("What is the length of hose in feet? "))
-lengthCm = lengthFeet * 12 * 2.54
-#print("The length of a ", f"{lengthFeet:.3f}", " foot hose is", f"{lengthCm:.3f}", " cm \n")
-print(f"The length of a {lengthFeet:.3f} foot hose is {lengthCm:.3f} cm \n") # more efficient
-
-# Calculate the cross sectional area hose with no pressure
-diamInch = float(input("What is the diameter of hose in inches? "))
-diamInitCm = diamInch * 2.54
-print(f"The diameter in cm is: {diamInitCm:.3f}")
-areaInit = ((diamInitCm)/2)**2 * math.pi
-print(f"The area of an unpressurized hose is {areaInit:.3f} cm2")
-
-# Calculate the cross sectional area of pressurized hose
-diamPress = float(input("What is the expected change in diameter of hose when pressurized in cm? ")) + diamInitCm
-print(f"The pressurized diameter in cm is: {diamPress:.3f}")
-areaPress = (diamPress/2)**2 * math.pi
-print(f"The area of a pressurized hose is {areaPress:.3f} cm2 \n")
-
-# Calculate volumes of hoses and change in volume
-volumeInit = lengthCm * areaInit
-volumePress = lengthCm * areaPress
-volumeChange = volumePress - volumeInit
-print(f"The initial volume is {volumeInit:.3f} cm3 The pressurized volume is {volumePress:.3f} cm3 The change in volume is {volumeChange:.3f}cm3 \n")
-
-numberHoses = int(input("How many hoses are in the test? "))
-print(f"For {numberHoses} Hoses the volumes are: ")
-print(f"The initial volume is {volumeInit * numberHoses:.3f} cm3 The pressurized volume is {volumePress * numberHoses:.3f} cm3 The change in volume is {volumeChange * numberHoses:.3f} cm3 \n")
-
-# Calculate stroke length needed
-boreInch = float(input("What is the bore diameter of the cylinder in inches "))
-boreCm = boreInch * 2.54
-stroke = (volumeChange * numberHoses)/(math.pi* (boreCm/2)**2)
-print(f"The stroke length for {numberHoses} hoses is {stroke:.3f} cm or {stroke/2.54:.3f} inches")
-
-# Calculate force needed to reach 100 PSI
-forceLbf = 100 * math.pi * boreInch**2
-print(f"The force need for a {boreInch} inch cylinder to reach 100 psi is  {forceLbf:.3f} LbF or {forceLbf*4.448:.3f} Newtons \n")
+PI = math.pi
+_QUARTER_PI = 0.25 * PI  # circle area = _QUARTER_PI * diameter * diameter
+
+
+def hose_makeup_volume(lengthFeet, diamInch, deltaDiamCm, numberHoses, boreInch):
+    """
+    Calculate hose volumes, makeup volume, cylinder stroke and force for the cart.
+    Inputs can be plain numbers or NumPy arrays (only arithmetic is used, so
+    arrays broadcast and a whole sweep of hose geometries is one call).
+    Returns a dict; lengths in cm, areas in cm2, volumes in cm3 (per hose unless
+    the key ends in Total), force in LbF.
+    """
+    # Calculate lenght of hose in cm
+    lengthCm = lengthFeet * 12 * 2.54
+
+    # Calculate the cross sectional area hose with no pressure
+    diamInitCm = diamInch * 2.54
+    areaInit = _QUARTER_PI * diamInitCm * diamInitCm
+
+    # Calculate the cross sectional area of pressurized hose
+    diamPress = deltaDiamCm + diamInitCm
+    areaPress = _QUARTER_PI * diamPress * diamPress
+
+    # Calculate volumes of hoses and change in volume
+    volumeInit = lengthCm * areaInit
+    volumePress = lengthCm * areaPress
+    volumeChange = volumePress - volumeInit
+
+    # Calculate stroke length needed
+    boreCm = boreInch * 2.54
+    stroke = (volumeChange * numberHoses)/(_QUARTER_PI * boreCm * boreCm)
+
+    # Calculate force needed to reach 100 PSI
+    forceLbf = 100 * PI * boreInch**2
+
+    return {
+        'lengthCm': lengthCm,
+        'diamInitCm': diamInitCm,
+        'areaInit': areaInit,
+        'diamPress': diamPress,
+        'areaPress': areaPress,
+        'volumeInit': volumeInit,
+        'volumePress': volumePress,
+        'volumeChange': volumeChange,
+        'volumeInitTotal': volumeInit * numberHoses,
+        'volumePressTotal': volumePress * numberHoses,
+        'volumeChangeTotal': volumeChange * numberHoses,
+        'stroke': stroke,
+        'forceLbf': forceLbf,
+    }
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="Makeup volume, stroke and force for pressurizing coolant hoses.")
+    p.add_argument('--length-ft', type=float, help="Length of each hose in feet")
+    p.add_argument('--diam-in', type=float, help="Hose inner diameter in inches")
+    p.add_argument('--delta-diam-cm', type=float, help="Expected change in hose diameter when pressurized in cm")
+    p.add_argument('--n-hoses', type=int, help="Number of hoses in the test")
+    p.add_argument('--bore-in', type=float, help="Cylinder bore diameter in inches")
+    p.add_argument('--csv', action='store_true', help="Print results as a CSV header line and value line")
+    args = p.parse_args(argv)
+    values = (args.length_ft, args.diam_in, args.delta_diam_cm, args.n_hoses, args.bore_in)
+    if any(x is None for x in values) and any(x is not None for x in values):
+        p.error("give all of --length-ft, --diam-in, --delta-diam-cm, --n-hoses and --bore-in, or none to be prompted")
+    return args
+
+
+def main(argv):
+    args = parse_args(argv)
+    if args.length_ft is None:
+        # No values on the command line: ask for them
+        lengthFeet = float(input("What is the length of hose in feet? "))
+        diamInch = float(input("What is the diameter of hose in inches? "))
+        deltaDiamCm = float(input("What is the expected change in diameter of hose when pressurized in cm? "))
+        numberHoses = int(input("How many hoses are in the test? "))
+        boreInch = float(input("What is the bore diameter of the cylinder in inches "))
+    else:
+        lengthFeet = args.length_ft
+        diamInch = args.diam_in
+        deltaDiamCm = args.delta_diam_cm
+        numberHoses = args.n_hoses
+        boreInch = args.bore_in
+    r = hose_makeup_volume(lengthFeet, diamInch, deltaDiamCm, numberHoses, boreInch)
+
+    if args.csv:
+        print(",".join(r.keys()))
+        print(",".join(f"{value:.6g}" for value in r.values()))
+        return
+
+    print(f"The length of a {lengthFeet:.3f} foot hose is {r['lengthCm']:.3f} cm \n")
+    print(f"The diameter in cm is: {r['diamInitCm']:.3f}")
+    print(f"The area of an unpressurized hose is {r['areaInit']:.3f} cm2")
+    print(f"The pressurized diameter in cm is: {r['diamPress']:.3f}")
+    print(f"The area of a pressurized hose is {r['areaPress']:.3f} cm2 \n")
+    print(f"The initial volume is {r['volumeInit']:.3f} cm3 The pressurized volume is {r['volumePress']:.3f} cm3 The change in volume is {r['volumeChange']:.3f}cm3 \n")
+    print(f"For {numberHoses} Hoses the volumes are: ")
+    print(f"The initial volume is {r['volumeInitTotal']:.3f} cm3 The pressurized volume is {r['volumePressTotal']:.3f} cm3 The change in volume is {r['volumeChangeTotal']:.3f} cm3 \n")
+    print(f"The stroke length for {numberHoses} hoses is {r['stroke']:.3f} cm or {r['stroke']/2.54:.3f} inches")
+    print(f"The force need for a {boreInch} inch cylinder to reach 100 psi is  {r['forceLbf']:.3f} LbF or {r['forceLbf']*4.448:.3f} Newtons \n")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
 
 
 # Code from Gpt5-mini to calc change in volume of water with temperature change